@@ -7,23 +7,53 @@ Este programa implementa el algoritmo de minimización de AFD usando el método
 de tabla de distingibilidad. El objetivo es encontrar pares de estados equivalentes
 que pueden ser combinados para minimizar el autómata.
 
+Los casos de prueba se resuelven con el algoritmo de refinamiento de particiones
+de Hopcroft, que obtiene las mismas clases de equivalencia en O(α·n·log n), o con
+el método de Brzozowski cuando el autómata es pequeño. Antes de Hopcroft se
+intentan unas rondas del algoritmo de Moore, que suele converger en pocas. La
+tabla de distinguibilidad (crear_tabla_distinguibilidad) no se usa al procesar
+los casos: es la implementación de referencia contra la que test_tarea1.py
+verifica los demás algoritmos.
+
 Autor: [Jose Miguel Muñoz Rios]
 Fecha: [05/08/2025]
 """
 
 import sys
-from typing import List, Tuple, Optional
+from array import array
+from collections import deque
+from itertools import chain
+from typing import Iterator, List, Sequence, Set, Tuple, Optional
+
+
+# Por debajo de este valor de α·n se usa el método de Brzozowski; por encima, Moore
+# y, si no converge pronto, Hopcroft
+UMBRAL_BRZOZOWSKI = 64
+
+# Rondas de Moore que se intentan antes de pasar a Hopcroft
+LIMITE_RONDAS_MOORE = 16
+
+# Máximo de subconjuntos que puede generar la determinización de Brzozowski antes
+# de abandonarla (el peor caso es exponencial) y usar Moore y Hopcroft
+LIMITE_SUBCONJUNTOS_BRZOZOWSKI = 4096
+
 
+# Tabla de traducción que intercambia los bytes 0 y 1 (negación de una máscara)
+_INVERTIR_BYTE = bytes.maketrans(b'\x00\x01', b'\x01\x00')
 
-def leer_archivo_entrada(nombre_archivo: str) -> List[str]:
+
+def leer_archivo_entrada(nombre_archivo: str) -> Iterator[List[str]]:
     """
-    Lee el archivo de entrada y retorna las líneas como lista.
+    Lee el archivo de entrada y retorna un iterador sobre sus líneas ya separadas en tokens.
+    
+    El archivo se lee completo de una vez; cada línea se separa en tokens a
+    medida que se consume, sin copiar ni desplazar el resto de las líneas.
     
     Args:
         nombre_archivo: Nombre del archivo a leer
         
     Returns:
-        Lista de líneas del archivo
+        Iterador de listas de tokens, una por línea del archivo
         
     Raises:
         FileNotFoundError: Si el archivo no existe
@@ -31,7 +61,7 @@ def leer_archivo_entrada(nombre_archivo: str) -> List[str]:
     """
     try:
         with open(nombre_archivo, 'r', encoding='utf-8') as f:
-            return f.read().splitlines()
+            return map(str.split, f.read().splitlines())
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo '{nombre_archivo}'")
         print("Asegúrate de que el archivo 'input.txt' esté en el mismo directorio que este script.")
@@ -41,14 +71,14 @@ def leer_archivo_entrada(nombre_archivo: str) -> List[str]:
         sys.exit(1)
 
 
-def validar_entrada(estados: int, estados_finales: List[int], transiciones: List[List[int]]) -> bool:
+def validar_entrada(estados: int, estados_finales: List[int], transiciones: Sequence[int]) -> bool:
     """
     Valida que los datos de entrada sean consistentes.
     
     Args:
         estados: Número total de estados
         estados_finales: Lista de estados finales
-        transiciones: Matriz de transiciones
+        transiciones: Matriz de transiciones aplanada por filas
         
     Returns:
         True si la entrada es válida, False en caso contrario
@@ -58,31 +88,38 @@ def validar_entrada(estados: int, estados_finales: List[int], transiciones: List
         print("Error: El número de estados debe ser positivo")
         return False
     
-    # Validar estados finales
-    for estado in estados_finales:
-        if estado < 0 or estado >= estados:
-            print(f"Error: Estado final {estado} fuera de rango [0, {estados-1}]")
-            return False
+    # Validar estados finales: min() y max() recorren la lista en C, y solo si
+    # hay un error se busca cuál estado lo causa para reportarlo
+    if estados_finales and (min(estados_finales) < 0 or max(estados_finales) >= estados):
+        estado = next(e for e in estados_finales if e < 0 or e >= estados)
+        print(f"Error: Estado final {estado} fuera de rango [0, {estados-1}]")
+        return False
     
     # Validar matriz de transiciones
-    if len(transiciones) != estados:
-        print(f"Error: Número de filas en transiciones ({len(transiciones)}) no coincide con estados ({estados})")
+    if len(transiciones) % estados != 0:
+        print(f"Error: Número de transiciones ({len(transiciones)}) no es múltiplo del número de estados ({estados})")
         return False
     
-    for i, fila in enumerate(transiciones):
-        for j, destino in enumerate(fila):
-            if destino < 0 or destino >= estados:
-                print(f"Error: Transición inválida en estado {i}, símbolo {j}: destino {destino} fuera de rango")
-                return False
+    # Igual que con los finales, una sola pasada en C sobre el arreglo completo
+    if transiciones and (min(transiciones) < 0 or max(transiciones) >= estados):
+        alfabeto = len(transiciones) // estados
+        k = next(k for k, destino in enumerate(transiciones) if destino < 0 or destino >= estados)
+        i, j = divmod(k, alfabeto)
+        print(f"Error: Transición inválida en estado {i}, símbolo {j}: destino {transiciones[k]} fuera de rango")
+        return False
     
     return True
 
 
 def crear_tabla_distinguibilidad(estados: int, estados_finales: List[int], 
-                                transiciones: List[List[int]]) -> List[List[bool]]:
+                                transiciones: array) -> bytearray:
     """
     Crea la tabla de distinguibilidad usando el algoritmo de minimización de AFD.
     
+    Es la implementación de referencia: main() no la usa (los casos se resuelven
+    con calcular_clases_equivalencia) y solo se ejecuta desde test_tarea1.py para
+    verificar los demás algoritmos.
+    
     El algoritmo funciona de la siguiente manera:
     1. Inicializa la tabla marcando como distinguibles los pares donde uno es final y otro no
     2. Itera hasta que no haya más cambios, aplicando la regla de propagación:
@@ -92,57 +129,414 @@ def crear_tabla_distinguibilidad(estados: int, estados_finales: List[int],
     Args:
         estados: Número total de estados
         estados_finales: Lista de estados finales
-        transiciones: Matriz donde transiciones[i][j] = estado destino desde i con símbolo j
+        transiciones: Matriz aplanada por filas donde transiciones[i * α + j] = estado
+            destino desde i con símbolo j (α = número de símbolos)
         
     Returns:
-        Matriz triangular donde tabla[i][j] = True indica que los estados i y j son distinguibles
+        Matriz de estados × estados guardada por filas en un bytearray contiguo,
+        donde tabla[i * estados + j] = 1 (con i < j) indica que i y j son distinguibles
     """
-    # Inicializar tabla triangular (solo la mitad superior)
-    tabla = [[False for _ in range(estados)] for _ in range(estados)]
+    # Inicializar tabla en un solo bloque contiguo de un byte por par (solo se usa
+    # la mitad superior); evita una lista de listas con un objeto bool por casilla
+    tabla = bytearray(estados * estados)
     
-    # Paso 1: Marcar como distinguibles los pares donde uno es final y otro no
+    # Máscara de estados finales: es_final[i] = 1 si i es final, consulta en O(1)
+    es_final = bytearray(estados)
+    for estado in estados_finales:
+        es_final[estado] = 1
+    
+    # Paso 1: Marcar como distinguibles los pares donde uno es final y otro no.
+    # La fila i es es_final[j] XOR es_final[i]: si i no es final es la máscara tal
+    # cual y si es final es la máscara invertida, así que se copia en C por filas
+    es_no_final = es_final.translate(_INVERTIR_BYTE)
     for i in range(estados):
-        for j in range(i + 1, estados):
-            # Si uno es final y otro no, son distinguibles
-            if (i in estados_finales) != (j in estados_finales):
-                tabla[i][j] = True
+        base = i * estados
+        mascara = es_no_final if es_final[i] else es_final
+        tabla[base + i + 1:base + estados] = mascara[i + 1:]
+    
+    # Si ya todos los pares son distinguibles (solo pasa con a lo sumo un estado
+    # final y uno no final), no hay nada que propagar
+    total_finales = sum(es_final)
+    if total_finales * (estados - total_finales) == estados * (estados - 1) // 2:
+        return tabla
     
     # Paso 2: Aplicar algoritmo iterativo de propagación
-    cambiado = True
-    iteracion = 0
-    while cambiado:
-        cambiado = False
-        iteracion += 1
-        
-        # Revisar todos los pares de estados
-        for i in range(estados):
-            for j in range(i + 1, estados):
-                # Solo procesar pares que aún no están marcados como distinguibles
-                if not tabla[i][j]:
-                    # Verificar todas las transiciones posibles
-                    for simbolo in range(len(transiciones[i])):
-                        # Verificar que el símbolo existe en ambos estados
-                        if simbolo >= len(transiciones[j]):
-                            continue
-                        
-                        # Obtener estados destino para este símbolo
-                        p = transiciones[i][simbolo]  # Destino desde estado i
-                        q = transiciones[j][simbolo]  # Destino desde estado j
-                        
-                        # Asegurar que accedemos a la parte triangular de la tabla
-                        if p > q:
-                            p, q = q, p
-                        
-                        # Si los destinos son distinguibles, entonces i y j también lo son
-                        if tabla[p][q]:
-                            tabla[i][j] = True
-                            cambiado = True
-                            break
+    _propagar_distinguibilidad(estados, transiciones, tabla)
     
     return tabla
 
 
-def encontrar_pares_equivalentes(estados: int, tabla: List[List[bool]]) -> List[Tuple[int, int]]:
+def _transiciones_inversas(estados: int, transiciones: array) -> List[List[List[int]]]:
+    """
+    Construye las transiciones inversas del autómata.
+    
+    Args:
+        estados: Número total de estados
+        transiciones: Matriz de transiciones aplanada por filas
+        
+    Returns:
+        Lista inversas donde inversas[simbolo][q] = estados p con δ(p, simbolo) = q
+    """
+    alfabeto = len(transiciones) // estados
+    inversas = [[[] for _ in range(estados)] for _ in range(alfabeto)]
+    for simbolo, inversa in enumerate(inversas):
+        # Los destinos del símbolo son la columna transiciones[simbolo::alfabeto]
+        for p, q in enumerate(transiciones[simbolo::alfabeto]):
+            inversa[q].append(p)
+    return inversas
+
+
+def _propagar_distinguibilidad(estados: int, transiciones: array,
+                               tabla: bytearray) -> None:
+    """
+    Núcleo del método de la tabla: marca pares hasta llegar a un punto fijo.
+    
+    En lugar de recorrer todos los pares en cada ronda mirando hacia adelante, la
+    propagación se hace hacia atrás con una cola de trabajo: cuando un par (p, q)
+    queda marcado como distinguible, se marcan todos los pares (i, j) con
+    δ(i, a) = p y δ(j, a) = q para algún símbolo a. Cada par entra a la cola a lo
+    sumo una vez, así que el trabajo total es O(n²·α) en lugar de O(n³·α). Si en
+    algún momento todos los pares quedan marcados, el autómata ya es mínimo y se
+    termina sin vaciar la cola.
+    
+    Args:
+        estados: Número total de estados
+        transiciones: Matriz de transiciones aplanada por filas
+        tabla: Tabla de distinguibilidad (por filas) ya inicializada; se modifica en el lugar
+    """
+    inversas = _transiciones_inversas(estados, transiciones)
+    
+    # La cola empieza con todos los pares ya marcados por la inicialización
+    pendientes = deque((i, j) for i in range(estados) for j in range(i + 1, estados)
+                       if tabla[i * estados + j])
+    marcados = len(pendientes)
+    total_pares = estados * (estados - 1) // 2
+    
+    while pendientes:
+        p, q = pendientes.popleft()
+        for inversa in inversas:
+            desde_q = inversa[q]
+            if not desde_q:
+                continue
+            for i in inversa[p]:
+                for j in desde_q:
+                    # δ es determinista y p != q, así que i != j; se ordena el
+                    # par para acceder a la parte triangular de la tabla
+                    menor, mayor = (i, j) if i < j else (j, i)
+                    indice = menor * estados + mayor
+                    if not tabla[indice]:
+                        tabla[indice] = 1
+                        pendientes.append((menor, mayor))
+                        marcados += 1
+                        if marcados == total_pares:
+                            return
+
+
+def minimizar_hopcroft(estados: int, estados_finales: List[int], transiciones: array,
+                       particion_inicial: Optional[List[Set[int]]] = None) -> List[Set[int]]:
+    """
+    Calcula las clases de estados equivalentes usando el algoritmo de Hopcroft.
+    
+    En lugar de revisar todos los pares de estados hasta llegar a un punto fijo,
+    se mantiene una partición de los estados en bloques y una lista de trabajo de
+    divisores (bloque, símbolo). Para cada divisor se calcula el conjunto X de
+    estados que llegan al bloque con ese símbolo, y se parte todo bloque Y que
+    X corta en dos mitades no vacías (Y∩X y Y\\X). De las dos mitades solo es
+    necesario agregar la más pequeña como nuevo divisor, lo que da un costo de
+    O(α·n·log n).
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz aplanada por filas donde transiciones[i * α + j] = estado
+            destino desde i con símbolo j (α = número de símbolos)
+        particion_inicial: Partición de la que se parte en lugar de {finales, no finales};
+            debe separar los finales de los no finales y no separar estados equivalentes
+            (por ejemplo, una ronda intermedia de minimizar_moore)
+        
+    Returns:
+        Lista de bloques; los estados de un mismo bloque son equivalentes
+    """
+    inversas = _transiciones_inversas(estados, transiciones)
+    alfabeto = len(inversas)
+    
+    if particion_inicial is None:
+        # Partición inicial: finales y no finales (descartando bloques vacíos)
+        finales = set(estados_finales)
+        no_finales = set(range(estados)) - finales
+        particion = [bloque for bloque in (finales, no_finales) if bloque]
+    else:
+        particion = [set(bloque) for bloque in particion_inicial]
+    bloque_de = [0] * estados
+    for indice, bloque in enumerate(particion):
+        for estado in bloque:
+            bloque_de[estado] = indice
+    
+    # Lista de trabajo inicial: basta con todos los bloques menos el más grande
+    if len(particion) < 2:
+        return particion
+    mayor = max(range(len(particion)), key=lambda indice: len(particion[indice]))
+    pendientes = [(indice, simbolo) for indice in range(len(particion)) if indice != mayor
+                  for simbolo in range(alfabeto)]
+    
+    while pendientes:
+        indice_divisor, simbolo = pendientes.pop()
+        inversa = inversas[simbolo]
+        
+        # X = estados que con este símbolo llegan al bloque divisor,
+        # agrupados según el bloque al que pertenecen
+        cortes = {}
+        for q in particion[indice_divisor]:
+            for p in inversa[q]:
+                cortes.setdefault(bloque_de[p], set()).add(p)
+        
+        for indice, interseccion in cortes.items():
+            bloque = particion[indice]
+            if len(interseccion) == len(bloque):
+                continue
+            
+            # Partir Y en Y∩X y Y\X: la mitad más pequeña pasa a ser un bloque nuevo
+            # y la otra se queda con el índice de Y. Solo se recorre y se renumera
+            # la mitad pequeña (calcular Y\X cuando es la pequeña cuesta |Y|, que
+            # es menos del doble de |Y∩X|), así que cada estado cambia de bloque a
+            # lo sumo log n veces
+            if 2 * len(interseccion) <= len(bloque):
+                menor = interseccion
+                bloque -= interseccion
+            else:
+                menor = bloque - interseccion
+                particion[indice] = interseccion
+            nuevo = len(particion)
+            particion.append(menor)
+            for estado in menor:
+                bloque_de[estado] = nuevo
+            
+            # Regla de la mitad más pequeña: si (Y, s) estaba pendiente, (Y, s) ya
+            # cubre la mitad grande y basta agregar la pequeña; si no, basta con
+            # la pequeña. En ambos casos se agrega (nuevo, s)
+            pendientes.extend((nuevo, s) for s in range(alfabeto))
+    
+    return particion
+
+
+def minimizar_moore(estados: int, estados_finales: List[int],
+                    transiciones: array) -> List[Set[int]]:
+    """
+    Calcula las clases de estados equivalentes con el algoritmo de Moore.
+    
+    Cada estado empieza en la clase 0 (no final) o 1 (final). En cada ronda la
+    firma de un estado es su clase junto con las clases de sus destinos, y las
+    clases se renumeran según las firmas distintas usando un diccionario. Cuando
+    una ronda no aumenta el número de clases, la partición es la final. Cada
+    ronda cuesta O(α·n) y nunca se construye la tabla de n² pares.
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz de transiciones aplanada por filas
+        
+    Returns:
+        Lista de clases; los estados de una misma clase son equivalentes
+    """
+    particion, _ = _refinar_moore(estados, estados_finales, transiciones, None)
+    return particion
+
+
+def _refinar_moore(estados: int, estados_finales: List[int], transiciones: array,
+                   max_rondas: Optional[int]) -> Tuple[List[Set[int]], bool]:
+    """
+    Ejecuta rondas del algoritmo de Moore, como máximo max_rondas.
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz de transiciones aplanada por filas
+        max_rondas: Límite de rondas, o None para llegar hasta la partición final
+        
+    Returns:
+        Tupla (particion, estable) donde estable indica si la partición ya es la final
+    """
+    alfabeto = len(transiciones) // estados
+    columnas = [transiciones[simbolo::alfabeto] for simbolo in range(alfabeto)]
+    
+    clase = [0] * estados
+    for estado in estados_finales:
+        clase[estado] = 1
+    total_clases = len(set(clase))
+    
+    estable = False
+    rondas = 0
+    while not estable and (max_rondas is None or rondas < max_rondas):
+        rondas += 1
+        # firma(i) = (clase(i), clase(δ(i, 0)), ..., clase(δ(i, α-1)))
+        firmas = zip(clase, *(map(clase.__getitem__, columna) for columna in columnas))
+        numeros = {}
+        clase = [numeros.setdefault(firma, len(numeros)) for firma in firmas]
+        estable = len(numeros) == total_clases
+        total_clases = len(numeros)
+    
+    particion = [set() for _ in range(max(clase) + 1)]
+    for estado, numero in enumerate(clase):
+        particion[numero].add(estado)
+    return [bloque for bloque in particion if bloque], estable
+
+
+def minimizar_brzozowski(estados: int, estados_finales: List[int],
+                         transiciones: array) -> Optional[List[Set[int]]]:
+    """
+    Calcula las clases de estados equivalentes con el método de Brzozowski.
+    
+    Se determiniza el autómata inverso partiendo del conjunto de estados finales.
+    Cada subconjunto alcanzado con una palabra w es exactamente {q : w^R ∈ L(q)},
+    así que dos estados son equivalentes si y solo si pertenecen a los mismos
+    subconjuntos alcanzables. Ese conjunto de subconjuntos es el estado inicial
+    que tendría cada estado en la segunda determinización (la del autómata
+    inverso del resultado), por lo que no hace falta construirla completa.
+    No se mantiene ninguna tabla de n² pares.
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz de transiciones aplanada por filas
+        
+    Returns:
+        Lista de clases; los estados de una misma clase son equivalentes. None si
+        la determinización supera LIMITE_SUBCONJUNTOS_BRZOZOWSKI subconjuntos
+    """
+    inversas = _transiciones_inversas(estados, transiciones)
+    
+    # Construcción de subconjuntos del autómata inverso
+    inicial = frozenset(estados_finales)
+    vistos = {inicial}
+    pendientes = [inicial]
+    while pendientes:
+        subconjunto = pendientes.pop()
+        for inversa in inversas:
+            siguiente = frozenset(p for q in subconjunto for p in inversa[q])
+            if siguiente not in vistos:
+                if len(vistos) >= LIMITE_SUBCONJUNTOS_BRZOZOWSKI:
+                    return None
+                vistos.add(siguiente)
+                pendientes.append(siguiente)
+    
+    # Firma de cada estado: los subconjuntos alcanzables que lo contienen
+    firmas = [[] for _ in range(estados)]
+    for indice, subconjunto in enumerate(vistos):
+        for q in subconjunto:
+            firmas[q].append(indice)
+    
+    clases = {}
+    for q, firma in enumerate(firmas):
+        clases.setdefault(tuple(firma), set()).add(q)
+    return list(clases.values())
+
+
+def agrupar_por_firma(estados: int, estados_finales: List[int],
+                      transiciones: array) -> Tuple[List[int], int, List[int], array]:
+    """
+    Agrupa los estados que tienen la misma firma (es final, fila de transiciones).
+    
+    Dos estados con la misma firma son trivialmente equivalentes, así que se
+    pueden fusionar antes de minimizar. El autómata resultante se forma con un
+    representante por grupo, y sus transiciones se renombran a los grupos. Es
+    una pasada O(n·α) que reduce n antes de cualquier algoritmo que dependa de él.
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz de transiciones aplanada por filas
+        
+    Returns:
+        Tupla (grupo, estados_reducidos, finales_reducidos, transiciones_reducidas)
+        donde grupo[i] es el estado del autómata reducido que representa a i
+    """
+    alfabeto = len(transiciones) // estados
+    finales = set(estados_finales)
+    
+    # La fila de cada estado se compara como bytes para poder usarla en un diccionario
+    grupo_de_firma = {}
+    grupo = [0] * estados
+    representantes = []
+    for i in range(estados):
+        firma = (i in finales, transiciones[i * alfabeto:(i + 1) * alfabeto].tobytes())
+        indice = grupo_de_firma.get(firma)
+        if indice is None:
+            indice = grupo_de_firma[firma] = len(representantes)
+            representantes.append(i)
+        grupo[i] = indice
+    
+    estados_reducidos = len(representantes)
+    finales_reducidos = [indice for indice, i in enumerate(representantes) if i in finales]
+    transiciones_reducidas = array('i', (
+        grupo[q] for i in representantes
+        for q in transiciones[i * alfabeto:(i + 1) * alfabeto]))
+    
+    return grupo, estados_reducidos, finales_reducidos, transiciones_reducidas
+
+
+def calcular_clases_equivalencia(estados: int, estados_finales: List[int],
+                                 transiciones: array) -> List[Set[int]]:
+    """
+    Calcula las clases de estados equivalentes del autómata.
+    
+    Primero fusiona los estados con la misma firma (ver agrupar_por_firma) y
+    minimiza el autómata reducido; luego expande cada clase del autómata
+    reducido a los estados originales de sus grupos. Los autómatas pequeños
+    (α·n < UMBRAL_BRZOZOWSKI) se minimizan con Brzozowski y el resto con Moore,
+    pasando a Hopcroft si no converge en LIMITE_RONDAS_MOORE rondas.
+    La tabla de distinguibilidad queda como método de referencia para verificar
+    los resultados (ver test_tarea1.py).
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz de transiciones aplanada por filas
+        
+    Returns:
+        Lista de clases; los estados de una misma clase son equivalentes
+    """
+    grupo, estados_reducidos, finales_reducidos, transiciones_reducidas = \
+        agrupar_por_firma(estados, estados_finales, transiciones)
+    
+    # Sin estados con la misma firma no hay nada que reducir
+    if estados_reducidos == estados:
+        return _minimizar(estados, estados_finales, transiciones)
+    
+    particion = _minimizar(estados_reducidos, finales_reducidos, transiciones_reducidas)
+    
+    miembros = [[] for _ in range(estados_reducidos)]
+    for i, indice in enumerate(grupo):
+        miembros[indice].append(i)
+    return [{i for indice in bloque for i in miembros[indice]} for bloque in particion]
+
+
+def _minimizar(estados: int, estados_finales: List[int], transiciones: array) -> List[Set[int]]:
+    """
+    Elige el algoritmo de minimización según el tamaño del autómata.
+    
+    Args:
+        estados: Número total de estados
+        estados_finales: Lista de estados finales
+        transiciones: Matriz de transiciones aplanada por filas
+        
+    Returns:
+        Lista de clases; los estados de una misma clase son equivalentes
+    """
+    if len(transiciones) < UMBRAL_BRZOZOWSKI:
+        particion = minimizar_brzozowski(estados, estados_finales, transiciones)
+        if particion is not None:
+            return particion
+    
+    # Unas pocas rondas de Moore bastan para la mayoría de los autómatas; si no
+    # converge (por ejemplo, en cadenas largas), Hopcroft parte de lo ya refinado
+    particion, estable = _refinar_moore(estados, estados_finales, transiciones,
+                                        LIMITE_RONDAS_MOORE)
+    if estable:
+        return particion
+    return minimizar_hopcroft(estados, estados_finales, transiciones, particion)
+
+
+def encontrar_pares_equivalentes(estados: int, tabla: bytearray) -> List[Tuple[int, int]]:
     """
     Encuentra todos los pares de estados equivalentes basándose en la tabla de distinguibilidad.
     
@@ -151,56 +545,146 @@ def encontrar_pares_equivalentes(estados: int, tabla: List[List[bool]]) -> List[
         tabla: Tabla de distinguibilidad
         
     Returns:
-        Lista de tuplas (i, j) donde i y j son estados equivalentes
+        Lista de tuplas (i, j) con i < j donde i y j son estados equivalentes, en
+        orden lexicográfico (la tabla se recorre por filas)
     """
     pares_equivalentes = []
+    agregar = pares_equivalentes.append
+    
+    # Recorrer la tabla triangular: en cada fila, find() salta en C las casillas
+    # marcadas y solo se vuelve al intérprete en los pares NO distinguibles
+    for i in range(estados):
+        base = i * estados
+        fin = base + estados
+        indice = tabla.find(0, base + i + 1, fin)
+        while indice != -1:
+            agregar((i, indice - base))
+            indice = tabla.find(0, indice + 1, fin)
+    
+    return pares_equivalentes
+
+
+def pares_desde_clases(estados: int, clases: List[Set[int]]) -> List[Tuple[int, int]]:
+    """
+    Lista los pares de estados equivalentes a partir de las clases de equivalencia.
+    
+    Los estados se recorren en orden y a cada uno se le emparejan los miembros
+    mayores de su clase (también en orden), así que los pares salen directamente
+    en orden lexicográfico y no hace falta ordenarlos después.
+    
+    Args:
+        estados: Número total de estados
+        clases: Clases de equivalencia (bloques de una partición de los estados)
+        
+    Returns:
+        Lista de tuplas (i, j) con i < j donde i y j son estados equivalentes, en
+        orden lexicográfico
+    """
+    clase_de = [0] * estados
+    miembros = []
+    for indice, bloque in enumerate(clases):
+        for estado in bloque:
+            clase_de[estado] = indice
+        miembros.append(sorted(bloque))
     
-    # Recorrer la tabla triangular
+    # vistos[c] = cuántos miembros de la clase c ya se recorrieron
+    vistos = [0] * len(miembros)
+    pares_equivalentes = []
     for i in range(estados):
-        for j in range(i + 1, estados):
-            # Si NO están marcados como distinguibles, son equivalentes
-            if not tabla[i][j]:
-                pares_equivalentes.append((i, j))
+        indice = clase_de[i]
+        vistos[indice] += 1
+        pares_equivalentes.extend((i, j) for j in miembros[indice][vistos[indice]:])
     
     return pares_equivalentes
 
 
-def procesar_caso_prueba() -> Optional[List[Tuple[int, int]]]:
+def leer_linea(lineas: Iterator[List[str]]) -> List[str]:
+    """
+    Obtiene los tokens de la siguiente línea de la entrada.
+    
+    Args:
+        lineas: Iterador de líneas separadas en tokens
+        
+    Returns:
+        Lista de tokens de la línea (vacía si la línea está en blanco)
+        
+    Raises:
+        EOFError: Si ya no quedan líneas
+    """
+    try:
+        return next(lineas)
+    except StopIteration:
+        raise EOFError("Se acabaron las líneas del archivo") from None
+
+
+def leer_entero(lineas: Iterator[List[str]]) -> int:
+    """
+    Lee una línea que contiene un único número entero.
+    
+    Args:
+        lineas: Iterador de líneas separadas en tokens
+        
+    Returns:
+        El entero leído
+        
+    Raises:
+        ValueError: Si la línea no contiene exactamente un entero
+    """
+    tokens = leer_linea(lineas)
+    if len(tokens) != 1:
+        raise ValueError(f"se esperaba un número entero y se encontró {' '.join(tokens)!r}")
+    return int(tokens[0])
+
+
+def procesar_caso_prueba(lineas: Iterator[List[str]]) -> Optional[List[Tuple[int, int]]]:
     """
     Procesa un caso de prueba completo.
     
+    Args:
+        lineas: Iterador de líneas de la entrada separadas en tokens
+        
     Returns:
         Lista de pares equivalentes, o None si hay error en la entrada
     """
     try:
         # Leer número de estados
-        estados = int(input().strip())
+        estados = leer_entero(lineas)
         if estados <= 0:
             print("Error: El número de estados debe ser positivo")
             return None
         
         # Leer alfabeto (no se usa en el algoritmo pero es parte del formato)
-        alfabeto = input().strip().split()
+        alfabeto = leer_linea(lineas)
         
-        # Leer estados finales
-        linea_finales = input().strip()
-        estados_finales = []
-        if linea_finales:  # Si no está vacía
-            estados_finales = list(map(int, linea_finales.split()))
+        # Leer estados finales (la línea puede estar vacía)
+        estados_finales = [int(token) for token in leer_linea(lineas)]
         
-        # Leer matriz de transiciones
-        transiciones = []
-        for _ in range(estados):
-            fila = list(map(int, input().strip().split()))
-            transiciones.append(fila)
+        # Leer matriz de transiciones; todas las filas deben tener el mismo ancho
+        filas = [leer_linea(lineas) for _ in range(estados)]
+        ancho = len(filas[0])
+        if len(set(map(len, filas))) > 1:
+            i = next(i for i, fila in enumerate(filas) if len(fila) != ancho)
+            print(f"Error: El estado {i} tiene {len(filas[i])} transiciones, se esperaban {ancho}")
+            return None
+        
+        # Convertir el bloque completo de una vez a un arreglo contiguo de enteros
+        # de C, aplanado por filas
+        try:
+            transiciones = array('i', map(int, chain.from_iterable(filas)))
+        except OverflowError:
+            # Un destino que no cabe en un int de C está fuera de rango; se valida
+            # la lista de enteros de Python para reportarlo con el mensaje de siempre
+            validar_entrada(estados, estados_finales,
+                            [int(token) for token in chain.from_iterable(filas)])
+            return None
         
         # Validar entrada
         if not validar_entrada(estados, estados_finales, transiciones):
             return None
         
         # Ejecutar algoritmo de minimización
-        tabla = crear_tabla_distinguibilidad(estados, estados_finales, transiciones)
-        pares_equivalentes = encontrar_pares_equivalentes(estados, tabla)
+        particion = calcular_clases_equivalencia(estados, estados_finales, transiciones)
+        pares_equivalentes = pares_desde_clases(estados, particion)
         
         return pares_equivalentes
         
@@ -217,7 +701,8 @@ def formatear_salida(pares_equivalentes: List[Tuple[int, int]]) -> str:
     Formatea la salida de los pares equivalentes.
     
     Args:
-        pares_equivalentes: Lista de pares equivalentes
+        pares_equivalentes: Lista de pares equivalentes, ya en orden lexicográfico
+            (como los producen pares_desde_clases y encontrar_pares_equivalentes)
         
     Returns:
         String formateado con los pares equivalentes
@@ -225,9 +710,7 @@ def formatear_salida(pares_equivalentes: List[Tuple[int, int]]) -> str:
     if not pares_equivalentes:
         return "None"
     
-    # Ordenar pares para salida consistente
-    pares_ordenados = sorted(pares_equivalentes)
-    return " ".join(f"({i},{j})" for i, j in pares_ordenados)
+    return " ".join(f"({i},{j})" for i, j in pares_equivalentes)
 
 
 def main():
@@ -238,21 +721,11 @@ def main():
     mostrando los pares de estados equivalentes encontrados.
     """
     # Leer archivo de entrada
-    lines = leer_archivo_entrada("input.txt")
-    
-    # Configurar función input para usar las líneas del archivo
-    def input():
-        if not lines:
-            raise EOFError("Se acabaron las líneas del archivo")
-        return lines.pop(0)
-    
-    # Hacer input() disponible globalmente
-    import builtins
-    builtins.input = input
+    lineas = leer_archivo_entrada("input.txt")
     
     try:
         # Leer número de casos de prueba
-        casos = int(input().strip())
+        casos = leer_entero(lineas)
         if casos <= 0:
             print("Error: El número de casos debe ser positivo")
             return
@@ -265,7 +738,7 @@ def main():
             print(f"\nCaso {caso}:")
             print("-" * 20)
             
-            pares_equivalentes = procesar_caso_prueba()
+            pares_equivalentes = procesar_caso_prueba(lineas)
             
             if pares_equivalentes is None:
                 print("Error en el procesamiento del caso")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Pruebas de los algoritmos de minimización de AFD
+================================================
+
+Cada algoritmo se compara contra el método de la tabla de distinguibilidad
+(crear_tabla_distinguibilidad + encontrar_pares_equivalentes), que se conserva
+como implementación de referencia.
+
+Ejecución: python3 -m unittest test_tarea1
+"""
+
+import random
+import unittest
+from array import array
+from typing import List, Set, Tuple
+
+import tarea1
+
+
+def afd_aleatorio(rng: random.Random, max_estados: int,
+                  max_alfabeto: int) -> Tuple[int, List[int], array]:
+    """
+    Genera un AFD aleatorio con pocos destinos distintos, para que haya estados equivalentes.
+
+    Returns:
+        Tupla (estados, estados_finales, transiciones aplanadas por filas)
+    """
+    estados = rng.randint(1, max_estados)
+    alfabeto = rng.randint(0, max_alfabeto)
+    destinos = rng.sample(range(estados), min(estados, rng.randint(1, 6)))
+    finales = sorted(rng.sample(range(estados), rng.randint(0, estados)))
+    transiciones = array('i', (
+        rng.choice(destinos) if rng.random() < 0.7 else rng.randrange(estados)
+        for _ in range(estados * alfabeto)))
+    return estados, finales, transiciones
+
+
+def afd_cadena(estados: int, alfabeto: int) -> Tuple[int, List[int], array]:
+    """
+    Genera la cadena i → i+1 (con todos los símbolos) cuyo último estado es el único final.
+
+    Todos sus estados son distinguibles y el algoritmo de Moore necesita n rondas.
+    """
+    transiciones = array('i', (min(i + 1, estados - 1)
+                               for i in range(estados) for _ in range(alfabeto)))
+    return estados, [estados - 1], transiciones
+
+
+def pares_referencia(estados: int, finales: List[int], transiciones: array) -> List[Tuple[int, int]]:
+    """Pares equivalentes según el método de la tabla."""
+    tabla = tarea1.crear_tabla_distinguibilidad(estados, finales, transiciones)
+    return tarea1.encontrar_pares_equivalentes(estados, tabla)
+
+
+def pares_de_particion(estados: int, particion: List[Set[int]]) -> List[Tuple[int, int]]:
+    """Pares equivalentes de una partición, en orden lexicográfico."""
+    return tarea1.pares_desde_clases(estados, particion)
+
+
+def casos_de_prueba() -> List[Tuple[int, List[int], array]]:
+    """AFD aleatorios pequeños y medianos, más algunas cadenas."""
+    rng = random.Random(2025)
+    casos = [afd_aleatorio(rng, 40, 4) for _ in range(400)]
+    casos += [afd_aleatorio(rng, 120, 10) for _ in range(20)]
+    casos += [afd_cadena(estados, alfabeto) for estados in (1, 2, 30, 100) for alfabeto in (1, 2)]
+    return casos
+
+
+class TestMinimizacion(unittest.TestCase):
+    """Compara cada algoritmo de minimización con el método de la tabla."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.casos = [(caso, pares_referencia(*caso)) for caso in casos_de_prueba()]
+
+    def test_calcular_clases_equivalencia(self):
+        for (estados, finales, transiciones), esperado in self.casos:
+            clases = tarea1.calcular_clases_equivalencia(estados, finales, transiciones)
+            self.assertEqual(pares_de_particion(estados, clases), esperado)
+
+    def test_minimizar_hopcroft(self):
+        for (estados, finales, transiciones), esperado in self.casos:
+            particion = tarea1.minimizar_hopcroft(estados, finales, transiciones)
+            self.assertEqual(pares_de_particion(estados, particion), esperado)
+
+    def test_minimizar_brzozowski(self):
+        resueltos = 0
+        for (estados, finales, transiciones), esperado in self.casos:
+            particion = tarea1.minimizar_brzozowski(estados, finales, transiciones)
+            if particion is None:
+                # Superó LIMITE_SUBCONJUNTOS_BRZOZOWSKI; se usa otro algoritmo
+                continue
+            resueltos += 1
+            self.assertEqual(pares_de_particion(estados, particion), esperado)
+        self.assertGreater(resueltos, 0)
+
+    def test_minimizar_moore(self):
+        for (estados, finales, transiciones), esperado in self.casos:
+            particion = tarea1.minimizar_moore(estados, finales, transiciones)
+            self.assertEqual(pares_de_particion(estados, particion), esperado)
+
+    def test_hopcroft_desde_moore_parcial(self):
+        for max_rondas in range(4):
+            for (estados, finales, transiciones), esperado in self.casos:
+                parcial, _ = tarea1._refinar_moore(estados, finales, transiciones, max_rondas)
+                particion = tarea1.minimizar_hopcroft(estados, finales, transiciones, parcial)
+                self.assertEqual(pares_de_particion(estados, particion), esperado)
+
+    def test_agrupar_por_firma(self):
+        for (estados, finales, transiciones), esperado in self.casos:
+            grupo, estados_reducidos, finales_reducidos, transiciones_reducidas = \
+                tarea1.agrupar_por_firma(estados, finales, transiciones)
+
+            # Los estados de un mismo grupo son equivalentes
+            equivalentes = set(esperado)
+            for i in range(estados):
+                for j in range(i + 1, estados):
+                    if grupo[i] == grupo[j]:
+                        self.assertIn((i, j), equivalentes)
+
+            # El autómata reducido es consistente con los grupos
+            self.assertEqual(len(transiciones_reducidas), estados_reducidos * (len(transiciones) // estados))
+            self.assertEqual(sorted({grupo[f] for f in finales}), finales_reducidos)
+
+
+class TestOrdenPares(unittest.TestCase):
+    """formatear_salida ya no ordena: los pares deben llegar en orden lexicográfico."""
+
+    def test_pares_desde_clases_ordenados(self):
+        rng = random.Random(7)
+        for estados, finales, transiciones in casos_de_prueba():
+            clases = tarea1.calcular_clases_equivalencia(estados, finales, transiciones)
+            # El orden de las clases no debe importar
+            rng.shuffle(clases)
+            pares = tarea1.pares_desde_clases(estados, clases)
+            self.assertEqual(pares, sorted(pares))
+
+    def test_encontrar_pares_equivalentes_ordenados(self):
+        for caso in casos_de_prueba():
+            pares = pares_referencia(*caso)
+            self.assertEqual(pares, sorted(pares))
+
+    def test_formatear_salida(self):
+        self.assertEqual(tarea1.formatear_salida([]), "None")
+        self.assertEqual(tarea1.formatear_salida([(0, 2), (1, 3), (1, 4)]), "(0,2) (1,3) (1,4)")
+
+
+if __name__ == "__main__":
+    unittest.main()